@@ -10,6 +10,36 @@ import re
 
 User = get_user_model()
 
+# Strips everything except digits from phone number input
+NON_DIGIT_RE = re.compile(r'\D')
+
+
+def normalize_indian_phone(phone_str):
+    """Normalize phone number to Django PhoneNumber format"""
+    if not phone_str:
+        return None
+    
+    # Remove all non-digits
+    digits_only = NON_DIGIT_RE.sub('', phone_str)
+    
+    # Convert to +91XXXXXXXXXX format
+    if len(digits_only) == 10:
+        # Assume Indian number
+        return f"+91{digits_only}"
+    elif len(digits_only) == 12 and digits_only.startswith('91'):
+        # 91XXXXXXXXXX -> +91XXXXXXXXXX
+        return f"+{digits_only}"
+    elif len(digits_only) >= 12 and '91' in digits_only[:3]:
+        # Handle various formats
+        if digits_only.startswith('91'):
+            return f"+{digits_only[:12]}"
+    
+    # If already in +91 format or other, return as-is after basic cleanup
+    if phone_str.startswith('+91') and len(phone_str) == 13:
+        return phone_str
+    
+    return None
+
 
 class EmailOrPhoneBackend(ModelBackend):
     """
@@ -29,43 +59,31 @@ class EmailOrPhoneBackend(ModelBackend):
         # Clean and validate the input
         username = str(username).strip()
         
-        # Try to find user by multiple methods
-        user = None
-        
-        # Method 1: Direct username match
-        try:
-            user = User.objects.get(username=username)
-        except User.DoesNotExist:
-            pass
+        # Build a single lookup covering every identifier type this input could be
+        query = Q(username=username)
         
-        # Method 2: Email match
-        if not user and '@' in username:
-            try:
-                user = User.objects.get(email=username)
-            except User.DoesNotExist:
-                pass
+        if '@' in username:
+            query |= Q(email=username)
         
-        # Method 3: Phone number match (Indian +91)
-        if not user and self._is_indian_phone(username):
+        phone_normalized = None
+        if self._is_indian_phone(username):
             # Normalize phone number format
             phone_normalized = self._normalize_indian_phone(username)
-            try:
-                user = User.objects.get(phone_number=phone_normalized)
-            except User.DoesNotExist:
-                pass
-        
-        # Method 4: If still not found, try combined search
-        if not user:
-            try:
-                phone_normalized = self._normalize_indian_phone(username) if self._is_indian_phone(username) else None
-                
-                query = Q(username=username) | Q(email=username)
-                if phone_normalized:
-                    query |= Q(phone_number=phone_normalized)
-                
-                user = User.objects.get(query)
-            except (User.DoesNotExist, User.MultipleObjectsReturned):
-                pass
+            if phone_normalized:
+                query |= Q(phone_number=phone_normalized)
+        
+        candidates = list(User.objects.filter(query))
+        
+        # Resolve in priority order: username, then email, then phone number
+        user = (
+            next((c for c in candidates if c.username == username), None) or
+            next((c for c in candidates if c.email.lower() == username.lower()), None) or
+            next((c for c in candidates if phone_normalized and c.phone_number == phone_normalized), None)
+        )
+        
+        # Fall back to an unambiguous match (e.g. case-insensitive DB collations)
+        if not user and len(candidates) == 1:
+            user = candidates[0]
         
         # Verify password and return user if valid
         if user and self._check_password(user, password):
@@ -76,7 +94,7 @@ class EmailOrPhoneBackend(ModelBackend):
     def _is_indian_phone(self, phone_str):
         """Check if string looks like an Indian phone number"""
         # Remove all non-digits
-        digits_only = re.sub(r'\D', '', phone_str)
+        digits_only = NON_DIGIT_RE.sub('', phone_str)
         
         # Indian phone patterns:
         # +91XXXXXXXXXX (10 digits after +91)
@@ -94,29 +112,7 @@ class EmailOrPhoneBackend(ModelBackend):
     
     def _normalize_indian_phone(self, phone_str):
         """Normalize phone number to Django PhoneNumber format"""
-        if not phone_str:
-            return None
-        
-        # Remove all non-digits
-        digits_only = re.sub(r'\D', '', phone_str)
-        
-        # Convert to +91XXXXXXXXXX format
-        if len(digits_only) == 10:
-            # Assume Indian number
-            return f"+91{digits_only}"
-        elif len(digits_only) == 12 and digits_only.startswith('91'):
-            # 91XXXXXXXXXX -> +91XXXXXXXXXX
-            return f"+{digits_only}"
-        elif len(digits_only) >= 12 and '91' in digits_only[:3]:
-            # Handle various formats
-            if digits_only.startswith('91'):
-                return f"+{digits_only[:12]}"
-        
-        # If already in +91 format or other, return as-is after basic cleanup
-        if phone_str.startswith('+91') and len(phone_str) == 13:
-            return phone_str
-        
-        return None
+        return normalize_indian_phone(phone_str)
     
     def _check_password(self, user, password):
         """Check if password is correct and user is active"""
@@ -11,8 +11,14 @@ from django.utils.translation import gettext_lazy as _
 from phonenumber_field.formfields import PhoneNumberField
 import re
 
+from .backends import normalize_indian_phone
+from .models import INDIAN_STATE_CHOICES
+
 User = get_user_model()
 
+# Usernames made only of digits and phone punctuation would be mistaken for phone numbers
+PHONE_LIKE_USERNAME_RE = re.compile(r'^[\d+\-\s()]+$')
+
 
 class GupShupRegistrationForm(UserCreationForm):
     """
@@ -69,44 +75,7 @@ class GupShupRegistrationForm(UserCreationForm):
     )
     
     state = forms.ChoiceField(
-        choices=[('', 'Select State')] + [
-            ('AN', 'Andaman and Nicobar Islands'),
-            ('AP', 'Andhra Pradesh'),
-            ('AR', 'Arunachal Pradesh'),
-            ('AS', 'Assam'),
-            ('BR', 'Bihar'),
-            ('CH', 'Chandigarh'),
-            ('CG', 'Chhattisgarh'),
-            ('DN', 'Dadra and Nagar Haveli'),
-            ('DD', 'Daman and Diu'),
-            ('DL', 'Delhi'),
-            ('GA', 'Goa'),
-            ('GJ', 'Gujarat'),
-            ('HR', 'Haryana'),
-            ('HP', 'Himachal Pradesh'),
-            ('JK', 'Jammu and Kashmir'),
-            ('JH', 'Jharkhand'),
-            ('KA', 'Karnataka'),
-            ('KL', 'Kerala'),
-            ('LD', 'Lakshadweep'),
-            ('MP', 'Madhya Pradesh'),
-            ('MH', 'Maharashtra'),
-            ('MN', 'Manipur'),
-            ('ML', 'Meghalaya'),
-            ('MZ', 'Mizoram'),
-            ('NL', 'Nagaland'),
-            ('OD', 'Odisha'),
-            ('PY', 'Puducherry'),
-            ('PB', 'Punjab'),
-            ('RJ', 'Rajasthan'),
-            ('SK', 'Sikkim'),
-            ('TN', 'Tamil Nadu'),
-            ('TS', 'Telangana'),
-            ('TR', 'Tripura'),
-            ('UP', 'Uttar Pradesh'),
-            ('UK', 'Uttarakhand'),
-            ('WB', 'West Bengal'),
-        ],
+        choices=[('', 'Select State')] + INDIAN_STATE_CHOICES,
         required=False,
         widget=forms.Select(attrs={
             'class': 'form-control'
@@ -175,13 +144,13 @@ class GupShupRegistrationForm(UserCreationForm):
         """Validate phone number uniqueness and format"""
         phone_number = self.cleaned_data.get('phone_number')
         if phone_number:
-            if User.objects.filter(phone_number=phone_number).exists():
-                raise ValidationError(_('This phone number is already registered.'))
-            
-            # Additional validation for Indian numbers
+            # Additional validation for Indian numbers (cheap, so run it before the DB lookup)
             phone_str = str(phone_number)
             if not phone_str.startswith('+91'):
                 raise ValidationError(_('Please enter a valid Indian phone number (+91).'))
+            
+            if User.objects.filter(phone_number=phone_number).exists():
+                raise ValidationError(_('This phone number is already registered.'))
         
         return phone_number
     
@@ -194,7 +163,7 @@ class GupShupRegistrationForm(UserCreationForm):
                 raise ValidationError(_('Username cannot be an email address.'))
             
             # Check if username looks like phone number
-            if re.match(r'^[\d+\-\s()]+$', username):
+            if PHONE_LIKE_USERNAME_RE.match(username):
                 raise ValidationError(_('Username cannot be a phone number.'))
             
             # Check uniqueness
@@ -358,6 +327,9 @@ class PasswordResetRequestForm(forms.Form):
         })
     )
     
+    # The reset flow only needs to identify and contact the user
+    CONTACT_FIELDS = ('id', 'username', 'email', 'phone_number')
+    
     def clean_email_or_phone(self):
         """Find user by email or phone"""
         identifier = self.cleaned_data['email_or_phone'].strip()
@@ -367,20 +339,18 @@ class PasswordResetRequestForm(forms.Form):
         # Try email first
         if '@' in identifier:
             try:
-                user = User.objects.get(email=identifier)
+                user = User.objects.only(*self.CONTACT_FIELDS).get(email=identifier)
             except User.DoesNotExist:
                 pass
         
         # Try phone number
         if not user and (identifier.startswith('+91') or identifier.isdigit()):
             # Normalize phone number
-            from .backends import EmailOrPhoneBackend
-            backend = EmailOrPhoneBackend()
-            phone_normalized = backend._normalize_indian_phone(identifier)
+            phone_normalized = normalize_indian_phone(identifier)
             
             if phone_normalized:
                 try:
-                    user = User.objects.get(phone_number=phone_normalized)
+                    user = User.objects.only(*self.CONTACT_FIELDS).get(phone_number=phone_normalized)
                 except User.DoesNotExist:
                     pass
         
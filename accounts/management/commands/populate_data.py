@@ -8,7 +8,9 @@ import random
 from datetime import datetime, timedelta
 from django.core.management.base import BaseCommand
 from django.contrib.auth import get_user_model
+from django.contrib.auth.hashers import make_password
 from django.core.files import File
+from django.db import transaction
 from django.utils import timezone
 from accounts.models import GupShupUser
 from posts.models import Post, PostMedia
@@ -36,6 +38,9 @@ class Command(BaseCommand):
     def handle(self, *args, **options):
         self.stdout.write(self.style.SUCCESS('🚀 Starting GupShup data population...'))
         
+        # Single reference time for every generated timestamp in this run
+        self.now = timezone.now()
+        
         # User profile data
         self.user_profiles = [
             {
@@ -223,8 +228,9 @@ class Command(BaseCommand):
         # Create posts
         self.create_posts(options['posts'])
         
-        # Create interactions
-        self.create_interactions()
+        # Create interactions in one transaction instead of committing each row
+        with transaction.atomic():
+            self.create_interactions()
         
         self.stdout.write(
             self.style.SUCCESS(f'✅ Successfully populated GupShup with realistic data!')
@@ -249,7 +255,7 @@ class Command(BaseCommand):
                 bio='🛠️ GupShup Platform Administrator | Managing the community',
                 city='India',
                 is_active=True,
-                date_joined=timezone.now() - timedelta(days=30)
+                date_joined=self.now - timedelta(days=30)
             )
             
             # Save admin credentials to file
@@ -262,7 +268,7 @@ class Command(BaseCommand):
                 f.write(f'Email: {admin_email}\n\n')
                 f.write('Access: http://localhost:8000/admin/\n')
                 f.write('Login: http://localhost:8000/login/\n\n')
-                f.write('Created: ' + str(timezone.now()) + '\n')
+                f.write('Created: ' + str(self.now) + '\n')
             
             self.stdout.write(
                 self.style.SUCCESS(f'👑 Admin user created! Credentials saved to {credentials_file}')
@@ -275,26 +281,41 @@ class Command(BaseCommand):
     def create_users(self, num_users):
         """Create regular users with realistic profiles"""
         created_users = 0
+        profiles = self.user_profiles[:num_users]
+        
+        # Look up all existing usernames in one query instead of one per profile
+        existing_usernames = set(
+            User.objects.filter(
+                username__in=[profile['username'] for profile in profiles]
+            ).values_list('username', flat=True)
+        )
+        
+        # Every demo user shares one password, so hash it once rather than per user,
+        # and only when a user is actually created (reruns skip hashing entirely)
+        demo_password_hash = None
         
-        for i, profile in enumerate(self.user_profiles[:num_users]):
-            if User.objects.filter(username=profile['username']).exists():
+        for i, profile in enumerate(profiles):
+            if profile['username'] in existing_usernames:
                 continue
+            
+            if demo_password_hash is None:
+                demo_password_hash = make_password('password123')
                 
             # Parse location
             location_parts = profile['location'].split(', ')
             city = location_parts[0] if location_parts else ''
             
             # Create user
-            user = User.objects.create_user(
+            user = User.objects.create(
                 username=profile['username'],
-                email=profile['email'],
-                password='password123',  # Simple password for demo
+                email=User.objects.normalize_email(profile['email']),
+                password=demo_password_hash,  # Simple password for demo
                 first_name=profile['first_name'],
                 last_name=profile['last_name'],
                 bio=profile['bio'],
                 city=city,
                 is_active=True,
-                date_joined=timezone.now() - timedelta(days=random.randint(1, 90))
+                date_joined=self.now - timedelta(days=random.randint(1, 90))
             )
             
             # Set avatar if exists
@@ -324,8 +345,14 @@ class Command(BaseCommand):
             f.write('GupShup User Login Credentials\n')
             f.write('==============================\n\n')
             
+            existing_usernames = set(
+                User.objects.filter(
+                    username__in=[profile['username'] for profile in self.user_profiles]
+                ).values_list('username', flat=True)
+            )
+            
             for profile in self.user_profiles:
-                if User.objects.filter(username=profile['username']).exists():
+                if profile['username'] in existing_usernames:
                     f.write(f"Username: {profile['username']}\n")
                     f.write(f"Password: password123\n")
                     f.write(f"Email: {profile['email']}\n")
@@ -334,7 +361,7 @@ class Command(BaseCommand):
             
             f.write(f'\nAll users have the password: password123\n')
             f.write(f'Login at: http://localhost:8000/login/\n')
-            f.write(f'Created: {timezone.now()}\n')
+            f.write(f'Created: {self.now}\n')
 
     def create_posts(self, num_posts):
         """Create posts with images and realistic content"""
@@ -354,7 +381,7 @@ class Command(BaseCommand):
             post = Post.objects.create(
                 author=author,
                 content=post_data['content'],
-                created_at=timezone.now() - timedelta(
+                created_at=self.now - timedelta(
                     days=random.randint(0, 30),
                     hours=random.randint(0, 23),
                     minutes=random.randint(0, 59)
@@ -428,7 +455,10 @@ class Command(BaseCommand):
                 )
                 comments_created += 1
         
-        # Create likes
+        # Create likes, checking existing pairs in memory instead of one lookup per like
+        existing_likes = set(
+            Like.objects.filter(post__in=posts).values_list('user_id', 'post_id')
+        )
         likes_created = 0
         for post in posts:
             # Random number of likes per post
@@ -436,13 +466,18 @@ class Command(BaseCommand):
             likers = random.sample([u for u in users if u != post.author], num_likes)
             
             for user in likers:
-                Like.objects.get_or_create(
-                    user=user,
-                    post=post
-                )
+                if (user.id, post.id) not in existing_likes:
+                    Like.objects.create(
+                        user=user,
+                        post=post
+                    )
+                    existing_likes.add((user.id, post.id))
                 likes_created += 1
         
-        # Create follows
+        # Create follows, again checking existing pairs in memory
+        existing_follows = set(
+            Follow.objects.filter(follower__in=users).values_list('follower_id', 'following_id')
+        )
         follows_created = 0
         for user in users:
             # Each user follows 2-5 random other users
@@ -450,10 +485,12 @@ class Command(BaseCommand):
             followees = random.sample([u for u in users if u != user], num_follows)
             
             for followee in followees:
-                Follow.objects.get_or_create(
-                    follower=user,
-                    following=followee
-                )
+                if (user.id, followee.id) not in existing_follows:
+                    Follow.objects.create(
+                        follower=user,
+                        following=followee
+                    )
+                    existing_follows.add((user.id, followee.id))
                 follows_created += 1
         
         self.stdout.write(
@@ -6,10 +6,8 @@ from posts.models import Post, PostMedia
 from social.models import Like, Comment, Follow
 from datetime import datetime, timedelta
 import random
-from faker import Faker
 
 User = get_user_model()
-fake = Faker(['en_IN'])  # Indian locale for realistic data
 
 class Command(BaseCommand):
     help = 'Populate database with realistic sample data for GupShup platform'
@@ -29,6 +27,10 @@ class Command(BaseCommand):
         )
 
     def handle(self, *args, **options):
+        # Imported here so --help and command discovery don't pay for loading Faker
+        from faker import Faker
+        self.fake = Faker(['en_IN'])  # Indian locale for realistic data
+        
         self.stdout.write(
             self.style.SUCCESS('🚀 Starting GupShup sample data population...')
         )
@@ -96,7 +98,7 @@ class Command(BaseCommand):
             email = f"{username}@example.com"
             
             # Create user with random join date (last 6 months)
-            join_date = fake.date_time_between(
+            join_date = self.fake.date_time_between(
                 start_date='-6M',
                 end_date='now',
                 tzinfo=timezone.get_current_timezone()
@@ -109,11 +111,11 @@ class Command(BaseCommand):
                 last_name=last_name,
                 city=city,
                 state=state,
-                bio=fake.text(max_nb_chars=200),
+                bio=self.fake.text(max_nb_chars=200),
                 is_verified=random.choice([True, False, False, False]),  # 25% verified
                 preferred_language=random.choice(['en', 'hi']),
                 date_joined=join_date,
-                last_login=fake.date_time_between(
+                last_login=self.fake.date_time_between(
                     start_date=join_date,
                     end_date='now',
                     tzinfo=timezone.get_current_timezone()
@@ -160,7 +162,7 @@ class Command(BaseCommand):
             author = random.choice(users)
             
             # Create post with random timestamp (last 3 months)
-            post_date = fake.date_time_between(
+            post_date = self.fake.date_time_between(
                 start_date='-3M',
                 end_date='now',
                 tzinfo=timezone.get_current_timezone()
@@ -170,7 +172,7 @@ class Command(BaseCommand):
             if i < len(post_templates):
                 content = post_templates[i]
             else:
-                content = fake.text(max_nb_chars=200) + " " + " ".join(random.choice(hashtag_groups))
+                content = self.fake.text(max_nb_chars=200) + " " + " ".join(random.choice(hashtag_groups))
             
             post = Post.objects.create(
                 author=author,
@@ -216,7 +218,7 @@ class Command(BaseCommand):
             
             # Update post likes count
             post.likes_count = len(likers)
-            post.save()
+            post.save(update_fields=['likes_count'])
         
         # Create comments
         comment_templates = [
@@ -240,7 +242,7 @@ class Command(BaseCommand):
             
             # Update post comments count
             post.comments_count = comments_count
-            post.save()
+            post.save(update_fields=['comments_count'])
 
     def update_user_statistics(self, users):
         """Update user follower and post counts"""
@@ -253,4 +255,4 @@ class Command(BaseCommand):
             # Update posts count
             user.posts_count = Post.objects.filter(author=user).count()
             
-            user.save()
\ No newline at end of file
+            user.save(update_fields=['followers_count', 'following_count', 'posts_count'])
\ No newline at end of file
@@ -0,0 +1,16 @@
+# Generated by Django 4.2.7 on 2026-10-16 17:50
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("accounts", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="gupshupuser",
+            index=models.Index(fields=["email"], name="gupshup_use_email_7f17bc_idx"),
+        ),
+    ]
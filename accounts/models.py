@@ -6,6 +6,47 @@ from django.core.exceptions import ValidationError
 from django.utils.translation import gettext_lazy as _
 
 
+# Indian states and union territories, shared by the user model and forms
+INDIAN_STATE_CHOICES = [
+    ('AN', 'Andaman and Nicobar Islands'),
+    ('AP', 'Andhra Pradesh'),
+    ('AR', 'Arunachal Pradesh'),
+    ('AS', 'Assam'),
+    ('BR', 'Bihar'),
+    ('CH', 'Chandigarh'),
+    ('CG', 'Chhattisgarh'),
+    ('DN', 'Dadra and Nagar Haveli'),
+    ('DD', 'Daman and Diu'),
+    ('DL', 'Delhi'),
+    ('GA', 'Goa'),
+    ('GJ', 'Gujarat'),
+    ('HR', 'Haryana'),
+    ('HP', 'Himachal Pradesh'),
+    ('JK', 'Jammu and Kashmir'),
+    ('JH', 'Jharkhand'),
+    ('KA', 'Karnataka'),
+    ('KL', 'Kerala'),
+    ('LD', 'Lakshadweep'),
+    ('MP', 'Madhya Pradesh'),
+    ('MH', 'Maharashtra'),
+    ('MN', 'Manipur'),
+    ('ML', 'Meghalaya'),
+    ('MZ', 'Mizoram'),
+    ('NL', 'Nagaland'),
+    ('OD', 'Odisha'),
+    ('PY', 'Puducherry'),
+    ('PB', 'Punjab'),
+    ('RJ', 'Rajasthan'),
+    ('SK', 'Sikkim'),
+    ('TN', 'Tamil Nadu'),
+    ('TS', 'Telangana'),
+    ('TR', 'Tripura'),
+    ('UP', 'Uttar Pradesh'),
+    ('UK', 'Uttarakhand'),
+    ('WB', 'West Bengal'),
+]
+
+
 class GupShupUser(AbstractUser):
     """
     User model for GupShup - Indian Social Media Platform
@@ -40,44 +81,7 @@ class GupShupUser(AbstractUser):
     state = models.CharField(
         max_length=100,
         blank=True,
-        choices=[
-            ('AN', 'Andaman and Nicobar Islands'),
-            ('AP', 'Andhra Pradesh'),
-            ('AR', 'Arunachal Pradesh'),
-            ('AS', 'Assam'),
-            ('BR', 'Bihar'),
-            ('CH', 'Chandigarh'),
-            ('CG', 'Chhattisgarh'),
-            ('DN', 'Dadra and Nagar Haveli'),
-            ('DD', 'Daman and Diu'),
-            ('DL', 'Delhi'),
-            ('GA', 'Goa'),
-            ('GJ', 'Gujarat'),
-            ('HR', 'Haryana'),
-            ('HP', 'Himachal Pradesh'),
-            ('JK', 'Jammu and Kashmir'),
-            ('JH', 'Jharkhand'),
-            ('KA', 'Karnataka'),
-            ('KL', 'Kerala'),
-            ('LD', 'Lakshadweep'),
-            ('MP', 'Madhya Pradesh'),
-            ('MH', 'Maharashtra'),
-            ('MN', 'Manipur'),
-            ('ML', 'Meghalaya'),
-            ('MZ', 'Mizoram'),
-            ('NL', 'Nagaland'),
-            ('OD', 'Odisha'),
-            ('PY', 'Puducherry'),
-            ('PB', 'Punjab'),
-            ('RJ', 'Rajasthan'),
-            ('SK', 'Sikkim'),
-            ('TN', 'Tamil Nadu'),
-            ('TS', 'Telangana'),
-            ('TR', 'Tripura'),
-            ('UP', 'Uttar Pradesh'),
-            ('UK', 'Uttarakhand'),
-            ('WB', 'West Bengal'),
-        ]
+        choices=INDIAN_STATE_CHOICES
     )
     
     # Language preferences
@@ -153,6 +157,7 @@ class GupShupUser(AbstractUser):
         verbose_name_plural = _('GupShup Users')
         indexes = [
             models.Index(fields=['phone_number']),
+            models.Index(fields=['email']),
             models.Index(fields=['city', 'state']),
             models.Index(fields=['created_at']),
             models.Index(fields=['last_seen']),
@@ -2,19 +2,17 @@ from django.shortcuts import render, redirect
 from django.contrib.auth import login, authenticate, logout
 from django.contrib.auth.decorators import login_required
 from django.contrib import messages
-from django.urls import reverse_lazy, reverse
-from django.views.generic import CreateView, UpdateView
+from django.urls import reverse_lazy
+from django.views.generic import UpdateView
 from django.utils.decorators import method_decorator
-from django.utils.translation import gettext_lazy as _
 from django.http import JsonResponse
-from django.core.mail import send_mail
-from django.conf import settings
 from .forms import (
     GupShupRegistrationForm, GupShupLoginForm, 
-    ProfileCompletionForm, PasswordResetRequestForm
+    ProfileCompletionForm, PasswordResetRequestForm,
+    PHONE_LIKE_USERNAME_RE
 )
+from .backends import normalize_indian_phone
 from .models import GupShupUser
-import json
 
 
 def home_view(request):
@@ -179,8 +177,7 @@ def check_username_availability(request):
             'message': 'Username cannot be an email address'
         })
     
-    import re
-    if re.match(r'^[\d+\-\s()]+$', username):
+    if PHONE_LIKE_USERNAME_RE.match(username):
         return JsonResponse({
             'available': False, 
             'message': 'Username cannot be a phone number'
@@ -225,9 +222,7 @@ def check_phone_availability(request):
         return JsonResponse({'available': True, 'message': 'Phone number is optional'})
     
     # Normalize phone number
-    from .backends import EmailOrPhoneBackend
-    backend = EmailOrPhoneBackend()
-    phone_normalized = backend._normalize_indian_phone(phone)
+    phone_normalized = normalize_indian_phone(phone)
     
     if not phone_normalized:
         return JsonResponse({
@@ -4,9 +4,12 @@ Handles message creation and conversation management
 """
 
 from django import forms
+from django.contrib.auth import get_user_model
 from django.core.exceptions import ValidationError
 from .models import Message, Conversation
 
+User = get_user_model()
+
 
 class MessageForm(forms.ModelForm):
     """
@@ -215,16 +218,14 @@ class StartConversationForm(forms.Form):
         """
         Validate the username exists
         """
-        from accounts.models import GupShupUser
-        
         username = self.cleaned_data.get('username', '').strip()
         
         if not username:
             raise ValidationError("Please enter a username.")
         
         try:
-            user = GupShupUser.objects.get(username=username, is_active=True)
-        except GupShupUser.DoesNotExist:
+            user = User.objects.get(username=username, is_active=True)
+        except User.DoesNotExist:
             raise ValidationError("User not found or inactive.")
         
         return username
@@ -233,11 +234,9 @@ class StartConversationForm(forms.Form):
         """
         Get the target user object
         """
-        from accounts.models import GupShupUser
-        
         username = self.cleaned_data.get('username')
         if username:
-            return GupShupUser.objects.get(username=username, is_active=True)
+            return User.objects.get(username=username, is_active=True)
         return None
 
 
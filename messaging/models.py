@@ -198,12 +198,13 @@ class Message(models.Model):
         """
         Override save to update conversation's last_message_at
         """
+        is_new = self._state.adding
         super().save(*args, **kwargs)
         
-        # Update conversation's last message timestamp
-        if not self.is_deleted:
+        # Update conversation's last message timestamp once, when the message is created
+        if is_new and not self.is_deleted:
             self.conversation.last_message_at = self.sent_at
-            self.conversation.save(update_fields=['last_message_at'])
+            self.conversation.save(update_fields=['last_message_at', 'updated_at'])
     
     def mark_as_read(self):
         """
@@ -260,19 +261,3 @@ class Message(models.Model):
         
         time_limit = timezone.now() - timezone.timedelta(minutes=5)
         return self.sent_at > time_limit and not self.is_edited
-    
-
-
-# Signal to update conversation timestamp when a message is created
-from django.db.models.signals import post_save
-from django.dispatch import receiver
-
-@receiver(post_save, sender=Message)
-def update_conversation_timestamp(sender, instance, created, **kwargs):
-    """
-    Update conversation's last_message_at when a new message is created
-    """
-    if created and not instance.is_deleted:
-        conversation = instance.conversation
-        conversation.last_message_at = instance.sent_at
-        conversation.save(update_fields=['last_message_at', 'updated_at'])
@@ -309,14 +309,14 @@ def conversation_action_ajax(request, conversation_id):
         if action == 'block':
             conversation.is_blocked = True
             conversation.blocked_by = request.user
-            conversation.save()
+            conversation.save(update_fields=['is_blocked', 'blocked_by', 'updated_at'])
             return JsonResponse({'success': True, 'message': 'User blocked'})
         
         elif action == 'unblock':
             if conversation.blocked_by == request.user:
                 conversation.is_blocked = False
                 conversation.blocked_by = None
-                conversation.save()
+                conversation.save(update_fields=['is_blocked', 'blocked_by', 'updated_at'])
                 return JsonResponse({'success': True, 'message': 'User unblocked'})
             else:
                 return JsonResponse({'success': False, 'message': 'You cannot unblock this conversation'})
@@ -324,7 +324,7 @@ def conversation_action_ajax(request, conversation_id):
         elif action == 'delete':
             # Soft delete - mark as inactive for this user
             conversation.is_active = False
-            conversation.save()
+            conversation.save(update_fields=['is_active', 'updated_at'])
             return JsonResponse({'success': True, 'message': 'Conversation deleted'})
         
         elif action == 'clear':
@@ -443,23 +443,25 @@ def conversation_stats_view(request):
         is_active=True
     ).count()
     
-    total_messages_sent = Message.objects.filter(
-        sender=request.user,
-        is_deleted=False
-    ).count()
-    
-    total_unread = 0
-    conversations = Conversation.get_user_conversations(request.user)
-    for conv in conversations:
-        total_unread += conv.get_unread_count(request.user)
-    
-    # Recent activity (last 7 days)
+    # Sent totals for all time and the last 7 days in one aggregate
     week_ago = timezone.now() - timedelta(days=7)
-    recent_messages = Message.objects.filter(
+    sent_stats = Message.objects.filter(
         sender=request.user,
-        sent_at__gte=week_ago,
         is_deleted=False
-    ).count()
+    ).aggregate(
+        total=Count('id'),
+        recent=Count('id', filter=Q(sent_at__gte=week_ago))
+    )
+    total_messages_sent = sent_stats['total']
+    recent_messages = sent_stats['recent']
+    
+    # Unread messages across all active conversations in a single query
+    total_unread = Message.objects.filter(
+        Q(conversation__user1=request.user) | Q(conversation__user2=request.user),
+        conversation__is_active=True,
+        is_deleted=False,
+        is_read=False
+    ).exclude(sender=request.user).count()
     
     context = {
         'total_conversations': total_conversations,
@@ -489,7 +491,7 @@ def message_search_ajax(request):
             sender=request.user,
             is_deleted=False,
             content__icontains=query
-        ).select_related('conversation', 'sender')
+        ).select_related('conversation__user1', 'conversation__user2', 'sender')
         
         # Filter by conversation if specified
         if conversation_id:
@@ -27,6 +27,32 @@ class Notification(models.Model):
         ('system', 'System Notification'),
     ]
     
+    NOTIFICATION_ICONS = {
+        'follow': 'bi-person-plus',
+        'follow_request': 'bi-person-plus-fill',
+        'follow_accepted': 'bi-person-check',
+        'like': 'bi-heart-fill',
+        'comment': 'bi-chat-fill',
+        'comment_reply': 'bi-reply-fill',
+        'message': 'bi-envelope-fill',
+        'mention': 'bi-at',
+        'post_shared': 'bi-share-fill',
+        'system': 'bi-gear-fill',
+    }
+    
+    NOTIFICATION_COLORS = {
+        'follow': 'text-primary',
+        'follow_request': 'text-info',
+        'follow_accepted': 'text-success',
+        'like': 'text-danger',
+        'comment': 'text-primary',
+        'comment_reply': 'text-primary',
+        'message': 'text-warning',
+        'mention': 'text-info',
+        'post_shared': 'text-success',
+        'system': 'text-secondary',
+    }
+    
     id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
     
     # Target user (who receives the notification)
@@ -104,37 +130,13 @@ class Notification(models.Model):
         """
         Get appropriate icon for notification type
         """
-        icons = {
-            'follow': 'bi-person-plus',
-            'follow_request': 'bi-person-plus-fill',
-            'follow_accepted': 'bi-person-check',
-            'like': 'bi-heart-fill',
-            'comment': 'bi-chat-fill',
-            'comment_reply': 'bi-reply-fill',
-            'message': 'bi-envelope-fill',
-            'mention': 'bi-at',
-            'post_shared': 'bi-share-fill',
-            'system': 'bi-gear-fill',
-        }
-        return icons.get(self.notification_type, 'bi-bell-fill')
+        return self.NOTIFICATION_ICONS.get(self.notification_type, 'bi-bell-fill')
     
     def get_color_class(self):
         """
         Get appropriate color class for notification type
         """
-        colors = {
-            'follow': 'text-primary',
-            'follow_request': 'text-info',
-            'follow_accepted': 'text-success',
-            'like': 'text-danger',
-            'comment': 'text-primary',
-            'comment_reply': 'text-primary',
-            'message': 'text-warning',
-            'mention': 'text-info',
-            'post_shared': 'text-success',
-            'system': 'text-secondary',
-        }
-        return colors.get(self.notification_type, 'text-primary')
+        return self.NOTIFICATION_COLORS.get(self.notification_type, 'text-primary')
     
     @classmethod
     def create_follow_notification(cls, follower, followed_user):
@@ -209,6 +211,9 @@ class NotificationSetting(models.Model):
     """
     Model to manage user notification preferences
     """
+    PREFERENCE_MEDIUMS = frozenset(['web', 'email', 'push'])
+    PREFERENCE_TYPES = frozenset(['follow', 'like', 'comment', 'message', 'mention'])
+    
     user = models.OneToOneField(
         settings.AUTH_USER_MODEL,
         on_delete=models.CASCADE,
@@ -263,31 +268,11 @@ class NotificationSetting(models.Model):
         """
         Check if a notification should be sent based on user preferences
         """
-        preference_map = {
-            'web': {
-                'follow': self.web_on_follow,
-                'like': self.web_on_like,
-                'comment': self.web_on_comment,
-                'message': self.web_on_message,
-                'mention': self.web_on_mention,
-            },
-            'email': {
-                'follow': self.email_on_follow,
-                'like': self.email_on_like,
-                'comment': self.email_on_comment,
-                'message': self.email_on_message,
-                'mention': self.email_on_mention,
-            },
-            'push': {
-                'follow': self.push_on_follow,
-                'like': self.push_on_like,
-                'comment': self.push_on_comment,
-                'message': self.push_on_message,
-                'mention': self.push_on_mention,
-            },
-        }
+        if medium not in self.PREFERENCE_MEDIUMS or notification_type not in self.PREFERENCE_TYPES:
+            return False
         
-        return preference_map.get(medium, {}).get(notification_type, False)
+        # Preference fields follow the <medium>_on_<type> naming scheme
+        return getattr(self, f'{medium}_on_{notification_type}')
 
 
 # Signal handlers for automatic notification creation
@@ -8,7 +8,7 @@ from django.contrib.auth.decorators import login_required
 from django.contrib import messages
 from django.http import JsonResponse
 from django.core.paginator import Paginator
-from django.db.models import Q
+from django.db.models import Q, Count
 from django.views.decorators.http import require_POST
 from django.utils import timezone
 import json
@@ -44,9 +44,13 @@ def notifications_list_view(request):
     page_number = request.GET.get('page')
     notifications_page = paginator.get_page(page_number)
     
-    # Get notification counts
-    total_count = Notification.objects.filter(recipient=request.user).count()
-    unread_count = Notification.objects.filter(recipient=request.user, is_read=False).count()
+    # Get notification counts in a single aggregate query
+    counts = Notification.objects.filter(recipient=request.user).aggregate(
+        total=Count('id'),
+        unread=Count('id', filter=Q(is_read=False))
+    )
+    total_count = counts['total']
+    unread_count = counts['unread']
     
     context = {
         'notifications': notifications_page,
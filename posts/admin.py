@@ -63,6 +63,11 @@ class PostAdmin(admin.ModelAdmin):
         })
     ]
     
+    list_select_related = ['author']
+    
+    # Avoid rendering every user as a <select> option on the change form
+    raw_id_fields = ['author']
+    
     inlines = [PostMediaInline]
     
     ordering = ['-created_at']
@@ -90,6 +95,10 @@ class PostMediaAdmin(admin.ModelAdmin):
         'post__content', 'post__author__username', 'caption'
     ]
     
+    # Post.__str__ reads author.username, so join both levels up front
+    list_select_related = ['post__author']
+    raw_id_fields = ['post']
+    
     ordering = ['post', 'order']
     
     def get_filename(self, obj):
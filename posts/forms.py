@@ -5,10 +5,13 @@ Forms for GupShup Posts with Indian context
 from django import forms
 from django.core.exceptions import ValidationError
 from django.utils.translation import gettext_lazy as _
-from .models import Post, PostMedia
+from .models import Post, PostMedia, HASHTAG_RE
 from social.models import Comment
 import re
 
+MENTION_RE = re.compile(r'@\w+')
+HASHTAG_SEARCH_RE = re.compile(r'^[a-zA-Z0-9_\u0900-\u097F]+$')
+
 
 class PostCreationForm(forms.ModelForm):
     """
@@ -86,12 +89,12 @@ class PostCreationForm(forms.ModelForm):
             raise ValidationError(_('Post cannot be empty. Add some text or media.'))
         
         # Check for spam (excessive hashtags)
-        hashtags = re.findall(r'#\w+', content)
+        hashtags = HASHTAG_RE.findall(content)
         if len(hashtags) > 10:
             raise ValidationError(_('Too many hashtags! Please use maximum 10 hashtags.'))
         
         # Check for spam (excessive mentions)
-        mentions = re.findall(r'@\w+', content)
+        mentions = MENTION_RE.findall(content)
         if len(mentions) > 5:
             raise ValidationError(_('Too many mentions! Please mention maximum 5 users.'))
         
@@ -178,7 +181,7 @@ class CommentForm(forms.ModelForm):
             raise ValidationError(_('Comment cannot be empty.'))
         
         # Check for spam (excessive mentions)
-        mentions = re.findall(r'@\w+', content)
+        mentions = MENTION_RE.findall(content)
         if len(mentions) > 3:
             raise ValidationError(_('Too many mentions! Please mention maximum 3 users.'))
         
@@ -266,9 +269,11 @@ class PostEditForm(forms.ModelForm):
         # Pre-populate form with existing data
         if self.instance and self.instance.pk:
             # Add information about existing media
-            media_count = self.instance.media_files.count()
+            # One query covers both the count and the first item's type
+            media_types = list(self.instance.media_files.values_list('media_type', flat=True))
+            media_count = len(media_types)
             if media_count > 0:
-                media_type = 'image' if self.instance.media_files.first().media_type == 'image' else 'video'
+                media_type = 'image' if media_types[0] == 'image' else 'video'
                 self.fields['new_media_file'].help_text = f'Currently has {media_count} {media_type}(s). Upload new file to replace all existing media.'
     
     def clean_content(self):
@@ -357,7 +362,7 @@ class HashtagSearchForm(forms.Form):
             hashtag = hashtag[1:]
         
         # Validate hashtag format
-        if not re.match(r'^[a-zA-Z0-9_\u0900-\u097F]+$', hashtag):
+        if not HASHTAG_SEARCH_RE.match(hashtag):
             raise ValidationError(_('Hashtag can only contain letters, numbers, and underscores.'))
         
         return hashtag
@@ -0,0 +1,22 @@
+# Generated by Django 4.2.7 on 2026-10-16 17:38
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("posts", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name="post",
+            name="gupshup_pos_privacy_b02401_idx",
+        ),
+        migrations.AddIndex(
+            model_name="post",
+            index=models.Index(
+                fields=["privacy", "-created_at"], name="gupshup_pos_privacy_d885da_idx"
+            ),
+        ),
+    ]
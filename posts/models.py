@@ -3,8 +3,12 @@ from django.conf import settings
 from django.utils.translation import gettext_lazy as _
 from django.core.validators import FileExtensionValidator
 from PIL import Image
+import re
 import uuid
 
+# Matches hashtags in post content, capturing the tag without the '#'
+HASHTAG_RE = re.compile(r'#(\w+)')
+
 
 def post_media_path(instance, filename):
     """Generate upload path for post media"""
@@ -115,7 +119,7 @@ class Post(models.Model):
         indexes = [
             models.Index(fields=['-created_at']),
             models.Index(fields=['author', '-created_at']),
-            models.Index(fields=['privacy']),
+            models.Index(fields=['privacy', '-created_at']),
             models.Index(fields=['location']),
         ]
     
@@ -126,9 +130,7 @@ class Post(models.Model):
     def save(self, *args, **kwargs):
         """Override save to extract hashtags"""
         # Extract hashtags from content
-        import re
-        hashtag_pattern = r'#(\w+)'
-        hashtags = re.findall(hashtag_pattern, self.content)
+        hashtags = HASHTAG_RE.findall(self.content)
         self.hashtags = ','.join(hashtags) if hashtags else ''
         
         # Set is_edited if this is an update
@@ -1,8 +1,12 @@
 from django import template
 import re
 
+from posts.models import HASHTAG_RE
+
 register = template.Library()
 
+WHITESPACE_RE = re.compile(r'\s+')
+
 @register.filter
 def remove_hashtags(content):
     """Remove hashtags from content to avoid duplication"""
@@ -10,11 +14,10 @@ def remove_hashtags(content):
         return content
     
     # Remove hashtags (words starting with #)
-    hashtag_pattern = r'#\w+'
-    clean_content = re.sub(hashtag_pattern, '', content)
+    clean_content = HASHTAG_RE.sub('', content)
     
     # Clean up extra spaces
-    clean_content = re.sub(r'\s+', ' ', clean_content).strip()
+    clean_content = WHITESPACE_RE.sub(' ', clean_content).strip()
     
     return clean_content
 
@@ -24,6 +27,5 @@ def extract_hashtags(content):
     if not content:
         return []
     
-    hashtag_pattern = r'#(\w+)'
-    hashtags = re.findall(hashtag_pattern, content)
+    hashtags = HASHTAG_RE.findall(content)
     return hashtags
\ No newline at end of file
@@ -1,10 +1,70 @@
 from django import template
 from django.utils.html import format_html
 from django.templatetags.static import static
-import re
+from functools import lru_cache
 
 register = template.Library()
 
+# Markup for render_video_thumbnail, filled in (and escaped) by format_html
+VIDEO_THUMBNAIL_HTML = '''
+    <div class="position-relative video-container" style="border-radius: 10px; overflow: hidden; cursor: pointer;">
+        <!-- Video thumbnail/poster -->
+        <div class="video-thumbnail" style="position: relative; width: 100%; height: 225px; background: linear-gradient(135deg, #667eea, #764ba2); display: flex; align-items: center; justify-content: center;">
+            <img src="{thumbnail_url}" alt="{description}" style="width: 100%; height: 100%; object-fit: cover;">
+            
+            <!-- Play overlay -->
+            <div class="position-absolute top-50 start-50 translate-middle play-overlay" style="pointer-events: none;">
+                <div class="bg-white rounded-circle d-flex align-items-center justify-content-center" style="width: 60px; height: 60px; box-shadow: 0 4px 15px rgba(0,0,0,0.3);">
+                    <i class="bi bi-play-fill" style="font-size: 24px; color: #667eea; margin-left: 3px;"></i>
+                </div>
+            </div>
+        </div>
+        
+        <!-- Hidden video element -->
+        <video class="d-none video-element" 
+               controls 
+               style="width: 100%; max-height: 400px; object-fit: contain;"
+               preload="metadata">
+            <source src="{video_url}" type="video/mp4">
+            Your browser does not support the video tag.
+        </video>
+        
+        <!-- Video badge -->
+        <div class="position-absolute top-0 end-0 m-2">
+            <div class="bg-dark bg-opacity-75 text-white rounded px-2 py-1 small">
+                <i class="bi bi-play-circle"></i> Video
+            </div>
+        </div>
+    </div>
+'''
+
+
+# Nature/Wildlife keywords
+NATURE_KEYWORDS = (
+    'nature', 'forest', 'tree', 'bird', 'wildlife', 'animal', 'safari',
+    'rain', 'monsoon', 'spring', 'moon', 'full moon', 'robin',
+    'mountain', 'river', 'green', 'natural'
+)
+
+# City/Urban keywords
+CITY_KEYWORDS = (
+    'city', 'urban', 'drone', 'building', 'metro', 'traffic',
+    'street', 'downtown', 'skyline', 'architecture'
+)
+
+# Music/Cultural keywords
+MUSIC_KEYWORDS = (
+    'music', 'devotional', 'anthem', 'song', 'melody', 'cultural',
+    'folk', 'classical', 'spiritual', 'jan gana mana', 'national anthem'
+)
+
+# India/Patriotic keywords
+INDIA_KEYWORDS = (
+    'india', 'indian', 'unity', 'diversity', 'incredible', 'welcome',
+    'national', 'flag', 'patriotic', 'bharat', 'hindustan'
+)
+
+
 @register.simple_tag
 def get_video_thumbnail(post, media=None):
     """
@@ -22,42 +82,23 @@ def get_video_thumbnail(post, media=None):
     # Combined text for analysis
     combined_text = f"{content} {filename}"
     
-    # Nature/Wildlife keywords
-    nature_keywords = [
-        'nature', 'forest', 'tree', 'bird', 'wildlife', 'animal', 'safari',
-        'rain', 'monsoon', 'spring', 'moon', 'full moon', 'robin',
-        'mountain', 'river', 'wildlife', 'green', 'natural'
-    ]
-    
-    # City/Urban keywords
-    city_keywords = [
-        'city', 'urban', 'drone', 'building', 'metro', 'traffic',
-        'street', 'downtown', 'skyline', 'architecture'
-    ]
-    
-    # Music/Cultural keywords
-    music_keywords = [
-        'music', 'devotional', 'anthem', 'song', 'melody', 'cultural',
-        'folk', 'classical', 'spiritual', 'jan gana mana', 'national anthem'
-    ]
-    
-    # India/Patriotic keywords
-    india_keywords = [
-        'india', 'indian', 'unity', 'diversity', 'incredible', 'welcome',
-        'national', 'flag', 'patriotic', 'bharat', 'hindustan'
-    ]
-    
+    return static(_thumbnail_for_text(combined_text))
+
+
+@lru_cache(maxsize=1024)
+def _thumbnail_for_text(combined_text):
+    """Pick the thumbnail path for a video's text; cached since feeds re-render the same posts"""
     # Check keywords in combined text
-    if any(keyword in combined_text for keyword in nature_keywords):
-        return static('img/video-thumbnails/nature-video.svg')
-    elif any(keyword in combined_text for keyword in city_keywords):
-        return static('img/video-thumbnails/city-video.svg')
-    elif any(keyword in combined_text for keyword in music_keywords):
-        return static('img/video-thumbnails/music-video.svg')
-    elif any(keyword in combined_text for keyword in india_keywords):
-        return static('img/video-thumbnails/music-video.svg')  # Use music for Indian content
+    if any(keyword in combined_text for keyword in NATURE_KEYWORDS):
+        return 'img/video-thumbnails/nature-video.svg'
+    elif any(keyword in combined_text for keyword in CITY_KEYWORDS):
+        return 'img/video-thumbnails/city-video.svg'
+    elif any(keyword in combined_text for keyword in MUSIC_KEYWORDS):
+        return 'img/video-thumbnails/music-video.svg'
+    elif any(keyword in combined_text for keyword in INDIA_KEYWORDS):
+        return 'img/video-thumbnails/music-video.svg'  # Use music for Indian content
     else:
-        return static('img/video-thumbnails/video-placeholder.svg')
+        return 'img/video-thumbnails/video-placeholder.svg'
 
 
 @register.simple_tag
@@ -70,6 +111,12 @@ def get_video_description(post, media=None):
     filename = media.file.name.lower() if media and media.file else ""
     combined_text = f"{content} {filename}"
     
+    return _description_for_text(combined_text)
+
+
+@lru_cache(maxsize=1024)
+def _description_for_text(combined_text):
+    """Pick the description label for a video's text"""
     if 'nature' in combined_text or 'forest' in combined_text or 'rain' in combined_text:
         return "🌿 NATURE VIDEO"
     elif 'city' in combined_text or 'drone' in combined_text or 'urban' in combined_text:
@@ -92,36 +139,9 @@ def render_video_thumbnail(post, media):
     thumbnail_url = get_video_thumbnail(post, media)
     description = get_video_description(post, media)
     
-    html = f'''
-    <div class="position-relative video-container" style="border-radius: 10px; overflow: hidden; cursor: pointer;">
-        <!-- Video thumbnail/poster -->
-        <div class="video-thumbnail" style="position: relative; width: 100%; height: 225px; background: linear-gradient(135deg, #667eea, #764ba2); display: flex; align-items: center; justify-content: center;">
-            <img src="{thumbnail_url}" alt="{description}" style="width: 100%; height: 100%; object-fit: cover;">
-            
-            <!-- Play overlay -->
-            <div class="position-absolute top-50 start-50 translate-middle play-overlay" style="pointer-events: none;">
-                <div class="bg-white rounded-circle d-flex align-items-center justify-content-center" style="width: 60px; height: 60px; box-shadow: 0 4px 15px rgba(0,0,0,0.3);">
-                    <i class="bi bi-play-fill" style="font-size: 24px; color: #667eea; margin-left: 3px;"></i>
-                </div>
-            </div>
-        </div>
-        
-        <!-- Hidden video element -->
-        <video class="d-none video-element" 
-               controls 
-               style="width: 100%; max-height: 400px; object-fit: contain;"
-               preload="metadata">
-            <source src="{media.file.url}" type="video/mp4">
-            Your browser does not support the video tag.
-        </video>
-        
-        <!-- Video badge -->
-        <div class="position-absolute top-0 end-0 m-2">
-            <div class="bg-dark bg-opacity-75 text-white rounded px-2 py-1 small">
-                <i class="bi bi-play-circle"></i> Video
-            </div>
-        </div>
-    </div>
-    '''
-    
-    return format_html(html)
\ No newline at end of file
+    return format_html(
+        VIDEO_THUMBNAIL_HTML,
+        thumbnail_url=thumbnail_url,
+        description=description,
+        video_url=media.file.url
+    )
\ No newline at end of file
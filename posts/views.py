@@ -3,7 +3,8 @@ from django.contrib.auth.decorators import login_required
 from django.contrib import messages
 from django.http import JsonResponse, Http404
 from django.core.paginator import Paginator
-from django.db.models import Q, Count, Prefetch, F
+from django.db.models import Q, Count, Prefetch, F, OuterRef, Subquery
+from django.db.models.functions import Coalesce
 from django.db import models
 from django.views.decorators.http import require_POST
 from django.views.decorators.csrf import csrf_exempt
@@ -41,7 +42,8 @@ def apply_content_mixing(posts_list):
     text_only_posts = []
     
     for post in posts_list:
-        media_types = list(post.media_files.values_list('media_type', flat=True))
+        # Read from the prefetched media_files cache instead of querying per post
+        media_types = {media.media_type for media in post.media_files.all()}
         if 'video' in media_types:
             video_posts.append(post)
         elif 'image' in media_types:
@@ -512,14 +514,14 @@ def edit_post_view(request, pk):
     else:
         form = PostEditForm(instance=post)
     
-    # Get existing media for display
-    existing_media = post.media_files.all().order_by('order')
+    # Get existing media for display, evaluated once for both the list and its count
+    existing_media = list(post.media_files.all().order_by('order'))
     
     context = {
         'form': form,
         'post': post,
         'existing_media': existing_media,
-        'media_count': existing_media.count(),
+        'media_count': len(existing_media),
         'title': 'Edit Post',
         'can_edit_media': True  # Flag to show media editing options
     }
@@ -560,7 +562,16 @@ def explore_view(request):
         privacy='public',
         created_at__gte=week_ago
     ).select_related('author').prefetch_related('media_files').annotate(
-        engagement_score=Count('likes') + Count('comments')
+        # likes_count is kept current by Like.save; comments are counted per post
+        # in a correlated subquery rather than joining and grouping both tables
+        engagement_score=F('likes_count') + Coalesce(
+            Subquery(
+                Comment.objects.filter(post=OuterRef('pk')).order_by().values('post').annotate(
+                    c=Count('pk')
+                ).values('c')
+            ),
+            0
+        )
     ).order_by('-engagement_score', '-created_at')[:20]
     
     # Get trending hashtags
@@ -685,14 +696,14 @@ def get_trending_hashtags(limit=10):
         privacy='public',
         created_at__gte=recent_date,
         hashtags__isnull=False
-    ).exclude(hashtags='')
+    ).exclude(hashtags='').values_list('hashtags', flat=True)
     
     # Extract all hashtags
     all_hashtags = []
-    for post in recent_posts:
-        if post.hashtags:
-            hashtags = [tag.strip() for tag in post.hashtags.split(',') if tag.strip()]
-            all_hashtags.extend(hashtags)
+    for post_hashtags in recent_posts:
+        if post_hashtags:
+            # Post.save stores \w+ tags joined by commas, so a plain split is enough
+            all_hashtags.extend(post_hashtags.split(','))
     
     # Count hashtag frequency
     hashtag_counts = Counter(all_hashtags)
@@ -719,13 +730,14 @@ def get_related_hashtags(hashtag, limit=5):
     posts_with_hashtag = Post.objects.filter(
         privacy='public',
         hashtags__icontains=hashtag
-    ).exclude(hashtags='')
+    ).exclude(hashtags='').values_list('hashtags', flat=True)
     
     # Extract all other hashtags from these posts
     related_tags = []
-    for post in posts_with_hashtag:
-        if post.hashtags:
-            tags = [tag.strip() for tag in post.hashtags.split(',') if tag.strip()]
+    # Stream rows instead of caching every matching post's hashtags at once
+    for post_hashtags in posts_with_hashtag.iterator(chunk_size=2000):
+        if post_hashtags:
+            tags = post_hashtags.split(',')
             # Remove the current hashtag
             tags = [tag for tag in tags if tag.lower() != hashtag.lower()]
             related_tags.extend(tags)
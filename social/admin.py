@@ -7,6 +7,7 @@ class FollowAdmin(admin.ModelAdmin):
     list_filter = ['status', 'created_at']
     search_fields = ['follower__username', 'following__username']
     list_select_related = ['follower', 'following']
+    raw_id_fields = ['follower', 'following']
     date_hierarchy = 'created_at'
     
 @admin.register(Like)
@@ -15,6 +16,7 @@ class LikeAdmin(admin.ModelAdmin):
     list_filter = ['created_at']
     search_fields = ['user__username', 'post__content']
     list_select_related = ['user', 'post']
+    raw_id_fields = ['user', 'post']
     date_hierarchy = 'created_at'
     
 @admin.register(Comment)
@@ -23,6 +25,7 @@ class CommentAdmin(admin.ModelAdmin):
     list_filter = ['created_at']
     search_fields = ['author__username', 'post__content', 'content']
     list_select_related = ['author', 'post']
+    raw_id_fields = ['author', 'post', 'parent_comment']
     date_hierarchy = 'created_at'
     
     def content_preview(self, obj):
@@ -9,6 +9,8 @@ from django.core.exceptions import ValidationError
 from django.utils.translation import gettext_lazy as _
 from django.db.models import Q
 
+from accounts.models import INDIAN_STATE_CHOICES
+
 User = get_user_model()
 
 
@@ -58,44 +60,7 @@ class UserSearchForm(forms.Form):
     )
     
     state = forms.ChoiceField(
-        choices=[('', 'All States')] + [
-            ('AN', 'Andaman and Nicobar Islands'),
-            ('AP', 'Andhra Pradesh'),
-            ('AR', 'Arunachal Pradesh'),
-            ('AS', 'Assam'),
-            ('BR', 'Bihar'),
-            ('CH', 'Chandigarh'),
-            ('CG', 'Chhattisgarh'),
-            ('DN', 'Dadra and Nagar Haveli'),
-            ('DD', 'Daman and Diu'),
-            ('DL', 'Delhi'),
-            ('GA', 'Goa'),
-            ('GJ', 'Gujarat'),
-            ('HR', 'Haryana'),
-            ('HP', 'Himachal Pradesh'),
-            ('JK', 'Jammu and Kashmir'),
-            ('JH', 'Jharkhand'),
-            ('KA', 'Karnataka'),
-            ('KL', 'Kerala'),
-            ('LD', 'Lakshadweep'),
-            ('MP', 'Madhya Pradesh'),
-            ('MH', 'Maharashtra'),
-            ('MN', 'Manipur'),
-            ('ML', 'Meghalaya'),
-            ('MZ', 'Mizoram'),
-            ('NL', 'Nagaland'),
-            ('OD', 'Odisha'),
-            ('PY', 'Puducherry'),
-            ('PB', 'Punjab'),
-            ('RJ', 'Rajasthan'),
-            ('SK', 'Sikkim'),
-            ('TN', 'Tamil Nadu'),
-            ('TS', 'Telangana'),
-            ('TR', 'Tripura'),
-            ('UP', 'Uttar Pradesh'),
-            ('UK', 'Uttarakhand'),
-            ('WB', 'West Bengal'),
-        ],
+        choices=[('', 'All States')] + INDIAN_STATE_CHOICES,
         required=False,
         widget=forms.Select(attrs={
             'class': 'form-control'
@@ -284,44 +249,7 @@ class UserProfileUpdateForm(forms.ModelForm):
     )
     
     state = forms.ChoiceField(
-        choices=[('', 'Select State')] + [
-            ('AN', 'Andaman and Nicobar Islands'),
-            ('AP', 'Andhra Pradesh'),
-            ('AR', 'Arunachal Pradesh'),
-            ('AS', 'Assam'),
-            ('BR', 'Bihar'),
-            ('CH', 'Chandigarh'),
-            ('CG', 'Chhattisgarh'),
-            ('DN', 'Dadra and Nagar Haveli'),
-            ('DD', 'Daman and Diu'),
-            ('DL', 'Delhi'),
-            ('GA', 'Goa'),
-            ('GJ', 'Gujarat'),
-            ('HR', 'Haryana'),
-            ('HP', 'Himachal Pradesh'),
-            ('JK', 'Jammu and Kashmir'),
-            ('JH', 'Jharkhand'),
-            ('KA', 'Karnataka'),
-            ('KL', 'Kerala'),
-            ('LD', 'Lakshadweep'),
-            ('MP', 'Madhya Pradesh'),
-            ('MH', 'Maharashtra'),
-            ('MN', 'Manipur'),
-            ('ML', 'Meghalaya'),
-            ('MZ', 'Mizoram'),
-            ('NL', 'Nagaland'),
-            ('OD', 'Odisha'),
-            ('PY', 'Puducherry'),
-            ('PB', 'Punjab'),
-            ('RJ', 'Rajasthan'),
-            ('SK', 'Sikkim'),
-            ('TN', 'Tamil Nadu'),
-            ('TS', 'Telangana'),
-            ('TR', 'Tripura'),
-            ('UP', 'Uttar Pradesh'),
-            ('UK', 'Uttarakhand'),
-            ('WB', 'West Bengal'),
-        ],
+        choices=[('', 'Select State')] + INDIAN_STATE_CHOICES,
         required=False,
         widget=forms.Select(attrs={
             'class': 'form-control'
@@ -46,25 +46,17 @@ def discover_users_view(request):
     if request.user.is_authenticated:
         all_users = list(trending_users) + list(city_users) + list(new_users)
         user_ids = [user.id for user in all_users]
-        following_ids = set(
-            Follow.objects.filter(
-                follower=request.user,
-                following_id__in=user_ids,
-                status='accepted'
-            ).values_list('following_id', flat=True)
-        )
-        
-        pending_ids = set(
+        follow_statuses = dict(
             Follow.objects.filter(
                 follower=request.user,
                 following_id__in=user_ids,
-                status='pending'
-            ).values_list('following_id', flat=True)
+                status__in=['accepted', 'pending']
+            ).values_list('following_id', 'status')
         )
         
         for user in all_users:
-            user.is_following = user.id in following_ids
-            user.is_pending = user.id in pending_ids
+            user.is_following = follow_statuses.get(user.id) == 'accepted'
+            user.is_pending = follow_statuses.get(user.id) == 'pending'
     
     context = {
         'trending_users': trending_users,
@@ -87,34 +79,27 @@ def user_search_view(request):
     if form.is_valid():
         query = form.cleaned_data.get('query', '')
         users = form.search_users(exclude_user=request.user if request.user.is_authenticated else None)
-        
-        # Add follow status for authenticated users
-        if request.user.is_authenticated:
-            user_ids = [user.id for user in users]
-            following_ids = set(
-                Follow.objects.filter(
-                    follower=request.user,
-                    following_id__in=user_ids,
-                    status='accepted'
-                ).values_list('following_id', flat=True)
-            )
-            
-            pending_ids = set(
-                Follow.objects.filter(
-                    follower=request.user,
-                    following_id__in=user_ids,
-                    status='pending'
-                ).values_list('following_id', flat=True)
-            )
-            
-            for user in users:
-                user.is_following = user.id in following_ids
-                user.is_pending = user.id in pending_ids
     
-    # Pagination
+    # Pagination - slice in the database instead of loading every match
     paginator = Paginator(users, 20)
     page_number = request.GET.get('page')
     page_obj = paginator.get_page(page_number)
+    page_obj.object_list = list(page_obj.object_list)
+    
+    # Add follow status for the users on this page only
+    if page_obj.object_list and request.user.is_authenticated:
+        user_ids = [user.id for user in page_obj.object_list]
+        follow_statuses = dict(
+            Follow.objects.filter(
+                follower=request.user,
+                following_id__in=user_ids,
+                status__in=['accepted', 'pending']
+            ).values_list('following_id', 'status')
+        )
+        
+        for user in page_obj.object_list:
+            user.is_following = follow_statuses.get(user.id) == 'accepted'
+            user.is_pending = follow_statuses.get(user.id) == 'pending'
     
     # Get suggested users if no search query
     suggested_users = []
@@ -142,20 +127,24 @@ def user_profile_view(request, username):
     # Redirect administrators to professional admin dashboard
     if user.is_superuser:
         
-        # Get admin dashboard data
-        total_users = GupShupUser.objects.count()
-        active_users = GupShupUser.objects.filter(is_active=True).count()
-        total_posts = Post.objects.count()
+        # Get admin dashboard data - one aggregate query per table
         today = timezone.now().date()
-        posts_today = Post.objects.filter(created_at__date=today).count()
+        user_stats = GupShupUser.objects.aggregate(
+            total=Count('id'),
+            active=Count('id', filter=Q(is_active=True))
+        )
+        post_stats = Post.objects.aggregate(
+            total=Count('id'),
+            today=Count('id', filter=Q(created_at__date=today))
+        )
         recent_users = GupShupUser.objects.order_by('-date_joined')[:5]
         recent_posts = Post.objects.select_related('author').order_by('-created_at')[:5]
         
         admin_context = {
             'admin_user': user,
             'stats': {
-                'users': {'total': total_users, 'active': active_users},
-                'posts': {'total': total_posts, 'today': posts_today}
+                'users': user_stats,
+                'posts': post_stats
             },
             'recent_users': recent_users,
             'recent_posts': recent_posts,
@@ -248,6 +237,7 @@ def follow_action_view(request, username):
             follow_obj.delete()
             action_taken = 'unfollowed'
             message = 'Unfollowed successfully'
+            status = None
         else:
             # Follow - create the relationship
             is_private = target_user.is_private
@@ -260,10 +250,9 @@ def follow_action_view(request, username):
             action_taken = 'followed'
             message = 'Follow request sent' if status == 'pending' else 'Now following'
         
-        # Get updated follow status
-        updated_follow = Follow.objects.filter(follower=request.user, following=target_user).first()
-        is_following = updated_follow.status == 'accepted' if updated_follow else False
-        is_pending = updated_follow.status == 'pending' if updated_follow else False
+        # Updated follow status follows directly from the action just taken
+        is_following = status == 'accepted'
+        is_pending = status == 'pending'
         
         return JsonResponse({
             'success': True,
@@ -297,9 +286,14 @@ def followers_list_view(request, username):
         following=user, status='accepted'
     ).select_related('follower').order_by('-created_at')
     
-    # Add follow status for each follower
+    paginator = Paginator(followers, 20)
+    page_number = request.GET.get('page')
+    page_obj = paginator.get_page(page_number)
+    page_obj.object_list = list(page_obj.object_list)
+    
+    # Add follow status for the followers on this page only
     if request.user.is_authenticated:
-        follower_ids = [f.follower.id for f in followers]
+        follower_ids = [f.follower.id for f in page_obj.object_list]
         following_ids = set(
             Follow.objects.filter(
                 follower=request.user,
@@ -308,19 +302,15 @@ def followers_list_view(request, username):
             ).values_list('following_id', flat=True)
         )
         
-        for follow_obj in followers:
+        for follow_obj in page_obj.object_list:
             follow_obj.follower.is_following = follow_obj.follower.id in following_ids
     
-    paginator = Paginator(followers, 20)
-    page_number = request.GET.get('page')
-    page_obj = paginator.get_page(page_number)
-    
     context = {
         'profile_user': user,
         'users': page_obj,  # Template expects 'users'
         'page_obj': page_obj,
         'list_type': 'followers',
-        'followers_count': Follow.objects.filter(following=user, status='accepted').count(),
+        'followers_count': paginator.count,
         'following_count': Follow.objects.filter(follower=user, status='accepted').count(),
         'title': f'{user.get_display_name()}\'s Followers'
     }
@@ -347,9 +337,14 @@ def following_list_view(request, username):
         follower=user, status='accepted'
     ).select_related('following').order_by('-created_at')
     
-    # Add follow status for each following
+    paginator = Paginator(following, 20)
+    page_number = request.GET.get('page')
+    page_obj = paginator.get_page(page_number)
+    page_obj.object_list = list(page_obj.object_list)
+    
+    # Add follow status for the users on this page only
     if request.user.is_authenticated and request.user != user:
-        following_ids = [f.following.id for f in following]
+        following_ids = [f.following.id for f in page_obj.object_list]
         user_following_ids = set(
             Follow.objects.filter(
                 follower=request.user,
@@ -358,20 +353,16 @@ def following_list_view(request, username):
             ).values_list('following_id', flat=True)
         )
         
-        for follow_obj in following:
+        for follow_obj in page_obj.object_list:
             follow_obj.following.is_following = follow_obj.following.id in user_following_ids
     
-    paginator = Paginator(following, 20)
-    page_number = request.GET.get('page')
-    page_obj = paginator.get_page(page_number)
-    
     context = {
         'profile_user': user,
         'users': page_obj,  # Template expects 'users'
         'page_obj': page_obj,
         'list_type': 'following',
         'followers_count': Follow.objects.filter(following=user, status='accepted').count(),
-        'following_count': Follow.objects.filter(follower=user, status='accepted').count(),
+        'following_count': paginator.count,
         'title': f'People {user.get_display_name()} Follows'
     }
     